@@ -145,16 +145,17 @@ class DHTEndpoint(BaseEndpoint):
         for address_cls, storage in self.dht.storages.items():
             for key, raw_values in storage.items.items():
                 values = self.dht.post_process_values([v.data for v in raw_values])
+                key_hex = hexlify(key).decode('utf-8')
                 dicts = []
                 for value in values:
                     data, public_key = value
                     dicts.append({
                         'endpoint': FAST_ADDR_TO_INTERFACE[address_cls],
                         'public_key': b64encode(public_key).decode('utf-8') if public_key else None,
-                        'key': hexlify(key).decode('utf-8'),
+                        'key': key_hex,
                         'value': hexlify(data).decode('utf-8')
                     })
-                results[hexlify(key).decode()] = dicts
+                results[key_hex] = dicts
         return Response(results)
 
     @docs(
@@ -184,9 +185,10 @@ class DHTEndpoint(BaseEndpoint):
         responses = sum([crawl.responses for crawl in crawls], [])
         stop = default_timer()
 
+        key_hex = hexlify(key).decode('utf-8')
         return Response({
             "values": [{'public_key': b64encode(public_key).decode('utf-8') if public_key else None,
-                        'key': hexlify(key).decode('utf-8'),
+                        'key': key_hex,
                         'value': hexlify(data).decode('utf-8')} for data, public_key in values],
             "debug": {
                 "requests": len(nodes_tried),
@@ -25,6 +25,11 @@ def ez_b64_decode(s):
     return base64.b64decode(s.encode())
 
 
+def find_peer_by_b64_key(peers, b64_key):
+    public_key_bin = ez_b64_decode(b64_key)
+    return next((peer for peer in peers if peer.public_key.key_to_bin() == public_key_bin), None)
+
+
 class IdentityEndpoint(BaseEndpoint):
 
     def __init__(self, middlewares=()):
@@ -212,11 +217,7 @@ class IdentityEndpoint(BaseEndpoint):
         channel = await self.communication_manager.load(request.match_info['pseudonym_name'],
                                                         request.headers.get('X-Rendezvous'))
 
-        subject = None
-        for peer in channel.peers:
-            if peer.public_key.key_to_bin() == ez_b64_decode(request.match_info['subject_key']):
-                subject = peer
-                break
+        subject = find_peer_by_b64_key(channel.peers, request.match_info['subject_key'])
         if subject is None:
             return Response({"success": False, "error": "failed to find subject"})
 
@@ -287,11 +288,7 @@ class IdentityEndpoint(BaseEndpoint):
 
         channel = await self.communication_manager.load(request.match_info['pseudonym_name'],
                                                         request.headers.get('X-Rendezvous'))
-        verifier = None
-        for peer in channel.peers:
-            if peer.public_key.key_to_bin() == ez_b64_decode(request.match_info['verifier_key']):
-                verifier = peer
-                break
+        verifier = find_peer_by_b64_key(channel.peers, request.match_info['verifier_key'])
         if verifier is None:
             return Response({"success": False, "error": "failed to find verifier"})
 
@@ -337,11 +334,7 @@ class IdentityEndpoint(BaseEndpoint):
 
         channel = await self.communication_manager.load(request.match_info['pseudonym_name'],
                                                         request.headers.get('X-Rendezvous'))
-        verifier = None
-        for peer in channel.peers:
-            if peer.public_key.key_to_bin() == ez_b64_decode(request.match_info['verifier_key']):
-                verifier = peer
-                break
+        verifier = find_peer_by_b64_key(channel.peers, request.match_info['verifier_key'])
         if verifier is None:
             return Response({"success": False, "error": "failed to find verifier"})
 
@@ -389,11 +382,7 @@ class IdentityEndpoint(BaseEndpoint):
 
         channel = await self.communication_manager.load(request.match_info['pseudonym_name'],
                                                         request.headers.get('X-Rendezvous'))
-        authority = None
-        for peer in channel.peers:
-            if peer.public_key.key_to_bin() == ez_b64_decode(request.match_info['authority_key']):
-                authority = peer
-                break
+        authority = find_peer_by_b64_key(channel.peers, request.match_info['authority_key'])
         if authority is None:
             return Response({"success": False, "error": "failed to find authority"})
 
@@ -442,11 +431,7 @@ class IdentityEndpoint(BaseEndpoint):
         channel = await self.communication_manager.load(request.match_info['pseudonym_name'],
                                                         request.headers.get('X-Rendezvous'))
 
-        subject = None
-        for peer in channel.peers:
-            if peer.public_key.key_to_bin() == ez_b64_decode(request.match_info['subject_key']):
-                subject = peer
-                break
+        subject = find_peer_by_b64_key(channel.peers, request.match_info['subject_key'])
         if subject is None:
             return Response({"success": False, "error": "failed to find subject"})
 
@@ -495,11 +480,7 @@ class IdentityEndpoint(BaseEndpoint):
         channel = await self.communication_manager.load(request.match_info['pseudonym_name'],
                                                         request.headers.get('X-Rendezvous'))
 
-        subject = None
-        for peer in channel.peers:
-            if peer.public_key.key_to_bin() == ez_b64_decode(request.match_info['subject_key']):
-                subject = peer
-                break
+        subject = find_peer_by_b64_key(channel.peers, request.match_info['subject_key'])
         if subject is None:
             return Response({"success": False, "error": "failed to find subject"})
 
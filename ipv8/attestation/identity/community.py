@@ -106,30 +106,30 @@ class IdentityCommunity(Community):
             return False
         attribute_hash = pseudonym.tree.elements[metadata.token_pointer].content_hash
         if "name" not in requested_keys or "date" not in requested_keys or "schema" not in requested_keys:
-            self.logger.debug(f"Not signing {str(metadata)}, it doesn't include the required fields!")
+            self.logger.debug("Not signing %s, it doesn't include the required fields!", metadata)
             return False
         if attribute_hash not in self.known_attestation_hashes:
-            self.logger.debug(f"Not signing {str(metadata)}, it doesn't point to known content!")
+            self.logger.debug("Not signing %s, it doesn't point to known content!", metadata)
             return False
         if pseudonym.public_key.key_to_bin() != self.known_attestation_hashes[attribute_hash][2]:
-            self.logger.debug(f"Not signing {str(metadata)}, attribute doesn't belong to key!")
+            self.logger.debug("Not signing %s, attribute doesn't belong to key!", metadata)
             return False
         # Refuse to sign blocks older than 5 minutes
         if time() > self.known_attestation_hashes[attribute_hash][1] + 300:
-            self.logger.debug(f"Not signing {str(metadata)}, timed out!")
+            self.logger.debug("Not signing %s, timed out!", metadata)
             return False
         if transaction['name'] != self.known_attestation_hashes[attribute_hash][0]:
-            self.logger.debug(f"Not signing {str(metadata)}, name does not match!")
+            self.logger.debug("Not signing %s, name does not match!", metadata)
             return False
         if (self.known_attestation_hashes[attribute_hash][3] is not None
                 and ({k: v for k, v in transaction.items() if k not in ["name", "date", "schema"]}
                      != self.known_attestation_hashes[attribute_hash][3])):
-            self.logger.debug(f"Not signing {str(metadata)}, metadata does not match!")
+            self.logger.debug("Not signing %s, metadata does not match!", metadata)
             return False
         for attestation in pseudonym.database.get_attestations_over(metadata):
             if any(authority == self.my_peer.public_key.key_to_bin()
                    for authority in pseudonym.database.get_authority(attestation)):
-                self.logger.debug(f"Not signing {str(metadata)}, already attested!")
+                self.logger.debug("Not signing %s, already attested!", metadata)
                 return False
         return True
 
@@ -147,7 +147,7 @@ class IdentityCommunity(Community):
         if meta_len + len(tokens) > SAFE_UDP_PACKET_LENGTH:
             packet_space = SAFE_UDP_PACKET_LENGTH - meta_len
             if packet_space < 0:
-                self.logger.warning(f"Attempting to disclose with packet of length {meta_len}, hoping for the best!")
+                self.logger.warning("Attempting to disclose with packet of length %d, hoping for the best!", meta_len)
             packet_space = max(0, packet_space)
             trim_len = packet_space // token_size
             tokens = tokens[-trim_len * token_size:]
@@ -168,7 +168,7 @@ class IdentityCommunity(Community):
             if correct and any(attribute_hash in known_attributes for attribute_hash in required_attributes):
                 for credential in pseudonym.get_credentials():
                     if self.should_sign(pseudonym, credential.metadata):
-                        self.logger.info(f"Attesting to {str(credential.metadata)}")
+                        self.logger.info("Attesting to %s", credential.metadata)
                         attestation = pseudonym.create_attestation(credential.metadata, self.my_peer.key)
                         pseudonym.add_attestation(self.my_peer.public_key, attestation)
                         self.ez_send(peer, AttestPayload(attestation.get_plaintext_signed()))
@@ -251,9 +251,9 @@ class IdentityCommunity(Community):
         """
         attestation = Attestation.unserialize(payload.attestation, peer.public_key)
         if self.pseudonym_manager.add_attestation(peer.public_key, attestation):
-            self.logger.info(f"Received attestation from {str(peer)}!")
+            self.logger.info("Received attestation from %s!", peer)
         else:
-            self.logger.warning(f"Received invalid attestation from {str(peer)}!")
+            self.logger.warning("Received invalid attestation from %s!", peer)
 
     @lazy_wrapper(RequestMissingPayload)
     def on_request_missing(self, peer: Peer, request: RequestMissingPayload) -> None:
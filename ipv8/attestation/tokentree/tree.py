@@ -86,7 +86,7 @@ class TokenTree(object):
                 self.unchained[token] = None
                 if len(self.unchained) > self.unchained_max_size:
                     self.unchained.popitem(False)
-                self._logger.info(f"Delaying unchained token {token}!")
+                self._logger.info("Delaying unchained token %s!", token)
                 return None
             elif token.get_hash() in self.elements:
                 shadow_token = self.elements[token.get_hash()]
@@ -213,4 +213,4 @@ class TokenTree(object):
         if retry_token is not None:
             self.unchained.pop(retry_token)
             if self.gather_token(retry_token) is None:
-                self._logger.warning(f"Dropped illegal token {retry_token}!")
+                self._logger.warning("Dropped illegal token %s!", retry_token)
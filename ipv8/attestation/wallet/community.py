@@ -39,6 +39,9 @@ class AttestationCommunity(Community):
     """
     community_id = unhexlify('b42c93d167a0fc4a0843f917d4bf1e9ebb340ec4')
 
+    # The number of bytes of an Attestation blob to send per message
+    chunk_size = 800
+
     def __init__(self, *args, **kwargs):
         working_directory = kwargs.pop('working_directory', '')
         db_name = kwargs.pop('db_name', 'attestations')
@@ -258,15 +261,22 @@ class AttestationCommunity(Community):
         self.send_attestation(peer.address, public_attestation_blob)
 
     def send_attestation(self, socket_address, blob, global_time=None):
-        # If we want to serve this request send the attestation in chunks of 800 bytes
+        if not blob:
+            # There is nothing to send, do not bother hashing and setting up the chunk messages
+            return
+        # If we want to serve this request send the attestation in chunks of ``chunk_size`` bytes
+        chunk_size = self.chunk_size
         sequence_number = 0
-        for i in range(0, len(blob), 800):
-            blob_chunk = blob[i:i + 800]
+        blob_hash = sha1(blob).digest()
+        # Slice chunks from a view of the blob, to avoid copying every chunk before it is packed
+        blob_view = memoryview(blob)
+        auth = BinMemberAuthenticationPayload(self.my_peer.public_key.key_to_bin())
+        for i in range(0, len(blob), chunk_size):
+            blob_chunk = blob_view[i:i + chunk_size]
             self.logger.debug("Sending attestation chunk %d to %s", sequence_number, str(socket_address))
             if global_time is None:
                 global_time = self.claim_global_time()
-            auth = BinMemberAuthenticationPayload(self.my_peer.public_key.key_to_bin())
-            payload = AttestationChunkPayload(sha1(blob).digest(), sequence_number, blob_chunk)
+            payload = AttestationChunkPayload(blob_hash, sequence_number, blob_chunk)
             dist = GlobalTimeDistributionPayload(global_time)
             packet = self._ez_pack(self._prefix, 2, [auth, dist, payload])
             self.endpoint.send(socket_address, packet)
@@ -286,9 +296,7 @@ class AttestationCommunity(Community):
             cache = self.request_cache.get(*hash_id)
             cache.attestation_map |= {(payload.sequence_number, payload.data), }
 
-            serialized = b""
-            for (_, chunk) in sorted(cache.attestation_map, key=lambda item: item[0]):
-                serialized += chunk
+            serialized = b"".join(chunk for _, chunk in sorted(cache.attestation_map, key=lambda item: item[0]))
 
             attestation_class = self.get_id_algorithm(cache.id_format).get_attestation_class()
             if sha1(serialized).digest() == payload.hash:
@@ -304,9 +312,7 @@ class AttestationCommunity(Community):
                     cache = self.request_cache.get(*peer_id)
                     cache.attestation_map |= {(payload.sequence_number, payload.data), }
 
-                    serialized = b""
-                    for (_, chunk) in sorted(cache.attestation_map, key=lambda item: item[0]):
-                        serialized += chunk
+                    serialized = b"".join(chunk for _, chunk in sorted(cache.attestation_map, key=lambda item: item[0]))
 
                     attestation_class = self.get_id_algorithm(cache.id_format).get_attestation_class()
                     if sha1(serialized).digest() == payload.hash:
@@ -455,8 +455,8 @@ class Community(EZPackOverlay):
         if self._prefix != data[:22]:
             return
         msg_id = data[22]
-        if self.decode_map[msg_id]:
-            handler = self.decode_map[msg_id]
+        handler = self.decode_map[msg_id]
+        if handler:
             try:
                 result = handler(source_address, data)
                 if iscoroutine(result):
@@ -297,6 +297,12 @@ class DHTCommunity(Community):
                 return payload.data, payload.public_key, payload.version
 
     def add_value(self, key, value, storage, max_age=MAX_ENTRY_AGE):
+        # Values that we already store have been verified before, so republishing them only needs a refresh
+        for stored_value in storage.items.get(key, []):
+            if stored_value.data == value:
+                storage.put(key, value, id_=stored_value.id, version=stored_value.version, max_age=max_age)
+                return
+
         unserialized = self.unserialize_value(value)
         if unserialized:
             _, public_key, version = unserialized
@@ -528,11 +534,12 @@ class DHTCommunity(Community):
 
         # For every prefix perform a refresh.
         # We only have to perform a single refresh for each prefix because find_values will crawl both IPv4 and IPv6.
-        for buckets in refresh_todo.values():
-            try:
-                await self.find_values(buckets[0].generate_id())
-            except DHTError:
-                pass
+        # The refreshes are independent of each other, so we crawl for all prefixes concurrently.
+        results = await gather(*[self.find_values(buckets[0].generate_id()) for buckets in refresh_todo.values()],
+                               return_exceptions=True)
+        for buckets, result in zip(refresh_todo.values(), results):
+            if isinstance(result, Exception) and not isinstance(result, DHTError):
+                raise result
 
             for bucket in buckets:
                 bucket.last_changed = now
@@ -547,7 +554,16 @@ class DHTCommunity(Community):
                 self.tokens.pop(node_id, None)
 
     def generate_token(self, node):
-        return hashlib.sha1(str(node).encode() + self.token_secrets[-1]).digest()
+        token = hashlib.sha1(str(node).encode())
+        token.update(self.token_secrets[-1])
+        return token.digest()
 
     def check_token(self, node, token):
-        return any([hashlib.sha1(str(node).encode() + secret).digest() == token for secret in self.token_secrets])
+        # Hash the node only once and resume from a copy of that state for every secret.
+        node_hash = hashlib.sha1(str(node).encode())
+        for secret in self.token_secrets:
+            secret_hash = node_hash.copy()
+            secret_hash.update(secret)
+            if secret_hash.digest() == token:
+                return True
+        return False
@@ -238,7 +238,9 @@ class EZPackOverlay(Overlay, ABC):
 
     def _verify_signature(self, auth: BinMemberAuthenticationPayload, data: bytes) -> Tuple[bool, bytes]:
         ec = default_eccrypto
-        public_key = ec.key_from_public_bin(auth.public_key_bin)
+        # Reuse the key of known peers, so we only have to decode the key material of new peers.
+        known_peer = self.network.verified_by_public_key_bin.get(auth.public_key_bin)
+        public_key = known_peer.public_key if known_peer else ec.key_from_public_bin(auth.public_key_bin)
         signature_length = ec.get_signature_length(public_key)
         remainder = data[2 + len(auth.public_key_bin):-signature_length]
         signature = data[-signature_length:]
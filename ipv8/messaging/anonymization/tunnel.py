@@ -318,7 +318,7 @@ class Hop(object):
 
     @property
     def mid(self):
-        return self.peer.public_key.key_to_hash()
+        return self.peer.mid
 
 
 class RelayRoute(Tunnel):
@@ -4,7 +4,7 @@ import abc
 import socket
 import typing
 from binascii import hexlify
-from struct import Struct, pack, unpack_from
+from struct import Struct, pack
 
 from .interfaces.udp.endpoint import DomainAddress, UDPv4Address, UDPv6Address
 
@@ -12,6 +12,12 @@ ADDRESS_TYPE_IPV4 = 0x01
 ADDRESS_TYPE_DOMAIN_NAME = 0x02
 ADDRESS_TYPE_IPV6 = 0x03
 
+_BYTE = Struct('>B')
+_SHORT = Struct('>H')
+_IPV4 = Struct('>4sH')
+_IPV6 = Struct('>16sH')
+_TYPED_IPV4 = Struct('>B4sH')
+_TYPED_IPV6 = Struct('>B16sH')
 
 FormatListType = typing.Union[str, "Serializable", typing.List["FormatListType"]]  # type:ignore
 
@@ -64,8 +70,7 @@ class NestedPayload(object):
         :rtype: bytes
         """
         data = self.serializer.pack_serializable(serializable)
-        data = pack('>H', len(data)) + data
-        return data
+        return _SHORT.pack(len(data)) + data
 
     def unpack(self, data, offset, unpack_list, serializable_class):
         """
@@ -106,7 +111,7 @@ class Bits(object):
         byte |= 0x04 if data[5] else 0x00
         byte |= 0x02 if data[6] else 0x00
         byte |= 0x01 if data[7] else 0x00
-        return pack('>B', byte)
+        return _BYTE.pack(byte)
 
     def unpack(self, data, offset, unpack_list):
         """
@@ -114,7 +119,7 @@ class Bits(object):
 
         :returns: the new offset
         """
-        byte, = unpack_from('>B', data, offset)
+        byte, = _BYTE.unpack_from(data, offset)
         bit_7 = 1 if 0x80 & byte else 0
         bit_6 = 1 if 0x40 & byte else 0
         bit_5 = 1 if 0x20 & byte else 0
@@ -147,14 +152,15 @@ class VarLen(object):
 
     def __init__(self, length_format, base=1):
         self.length_format = length_format
-        self.length_size = Struct(length_format).size
+        self.length_struct = Struct(length_format)
+        self.length_size = self.length_struct.size
         self.base = base
 
     def pack(self, data):
-        return pack(self.length_format, len(data) // self.base) + data
+        return self.length_struct.pack(len(data) // self.base) + data
 
     def unpack(self, data, offset, unpack_list):
-        str_length = unpack_from(self.length_format, data, offset)[0] * self.base
+        str_length = self.length_struct.unpack_from(data, offset)[0] * self.base
         unpack_list.append(data[offset + self.length_size: offset + self.length_size + str_length])
         return offset + self.length_size + str_length
 
@@ -165,10 +171,10 @@ class IPv4:
     """
 
     def pack(self, data):
-        return pack('>4sH', socket.inet_aton(data[0]), data[1])
+        return _IPV4.pack(socket.inet_aton(data[0]), data[1])
 
     def unpack(self, data, offset, unpack_list):
-        host_bytes, port = unpack_from('>4sH', data, offset)
+        host_bytes, port = _IPV4.unpack_from(data, offset)
         unpack_list.append(UDPv4Address(socket.inet_ntoa(host_bytes), port))
         return offset + 6
 
@@ -180,28 +186,28 @@ class Address:
 
     def pack(self, address):
         if isinstance(address, UDPv6Address):
-            return pack('>B16sH', ADDRESS_TYPE_IPV6, socket.inet_pton(socket.AF_INET6, address.ip), address.port)
+            return _TYPED_IPV6.pack(ADDRESS_TYPE_IPV6, socket.inet_pton(socket.AF_INET6, address.ip), address.port)
         if not self.ip_only and isinstance(address, DomainAddress):
             host_bytes = address.host.encode()
             return pack(f'>BH{len(host_bytes)}sH', ADDRESS_TYPE_DOMAIN_NAME, len(host_bytes), host_bytes, address.port)
         if isinstance(address, tuple):
-            return pack('>B4sH', ADDRESS_TYPE_IPV4, socket.inet_pton(socket.AF_INET, address[0]), address[1])
+            return _TYPED_IPV4.pack(ADDRESS_TYPE_IPV4, socket.inet_pton(socket.AF_INET, address[0]), address[1])
         raise PackError(f'Unexpected address type {address}')
 
     def unpack(self, data, offset, unpack_list):
-        address_type, = unpack_from('>B', data, offset)
+        address_type, = _BYTE.unpack_from(data, offset)
         if address_type == ADDRESS_TYPE_IPV4:
-            ip_bytes, port = unpack_from('>4sH', data, offset + 1)
+            ip_bytes, port = _IPV4.unpack_from(data, offset + 1)
             unpack_list.append(UDPv4Address(socket.inet_ntop(socket.AF_INET, ip_bytes), port))
             return offset + 7
         elif address_type == ADDRESS_TYPE_IPV6:
-            ip_bytes, port = unpack_from('>16sH', data, offset + 1)
+            ip_bytes, port = _IPV6.unpack_from(data, offset + 1)
             unpack_list.append(UDPv6Address(socket.inet_ntop(socket.AF_INET6, ip_bytes), port))
             return offset + 19
         elif not self.ip_only and address_type == ADDRESS_TYPE_DOMAIN_NAME:
-            length, = unpack_from('>H', data, offset + 1)
+            length, = _SHORT.unpack_from(data, offset + 1)
             host = data[offset + 3: offset + 3 + length].decode()
-            unpack_list.append(DomainAddress(host, unpack_from('>H', data, offset + 3 + length)[0]))
+            unpack_list.append(DomainAddress(host, _SHORT.unpack_from(data, offset + 3 + length)[0]))
             return offset + 5 + length
         else:
             raise PackError(f'Cannot unpack address type {address_type}')
@@ -212,13 +218,14 @@ class ListOf:
     def __init__(self, packer, length_format='>B'):
         self.packer = packer
         self.length_format = length_format
-        self.length_size = Struct(length_format).size
+        self.length_struct = Struct(length_format)
+        self.length_size = self.length_struct.size
 
     def pack(self, data):
-        return pack(self.length_format, len(data)) + b''.join([self.packer.pack(item) for item in data])
+        return self.length_struct.pack(len(data)) + b''.join([self.packer.pack(item) for item in data])
 
     def unpack(self, data, offset, unpack_list, *args):
-        length, = unpack_from(self.length_format, data, offset)
+        length, = self.length_struct.unpack_from(data, offset)
         offset += self.length_size
 
         result = []
@@ -232,60 +239,66 @@ class DefaultStruct:
 
     def __init__(self, format_str):
         self.format_str = format_str
-        self.size = Struct(format_str).size
+        self.struct = Struct(format_str)
+        self.size = self.struct.size
 
     def pack(self, *data):
-        return pack(self.format_str, *data)
+        return self.struct.pack(*data)
 
     def unpack(self, data, offset, unpack_list):
-        result = unpack_from(self.format_str, data, offset)
+        result = self.struct.unpack_from(data, offset)
         unpack_list.append(result if len(result) > 1 else result[0])
         return offset + self.size
 
 
+# These packers do not keep any state, so they can be shared between all Serializer instances.
+_STATELESS_PACKERS = {
+    '?': DefaultStruct(">?"),
+    'B': DefaultStruct(">B"),
+    'BBH': DefaultStruct(">BBH"),
+    'BH': DefaultStruct(">BH"),
+    'c': DefaultStruct(">c"),
+    'f': DefaultStruct(">f"),
+    'd': DefaultStruct(">d"),
+    'H': DefaultStruct(">H"),
+    'HH': DefaultStruct(">HH"),
+    'I': DefaultStruct(">I"),
+    'l': DefaultStruct(">l"),
+    'LL': DefaultStruct(">LL"),
+    'q': DefaultStruct(">q"),
+    'Q': DefaultStruct(">Q"),
+    'QH': DefaultStruct(">QH"),
+    'QL': DefaultStruct(">QL"),
+    'QQHHBH': DefaultStruct(">QQHHBH"),
+    'ccB': DefaultStruct(">ccB"),
+    '4SH': DefaultStruct(">4sH"),
+    '20s': DefaultStruct(">20s"),
+    '32s': DefaultStruct(">32s"),
+    '64s': DefaultStruct(">64s"),
+    '74s': DefaultStruct(">74s"),
+    'c20s': DefaultStruct(">c20s"),
+    'bits': Bits(),
+    'ipv4': IPv4(),
+    'ip_address': Address(ip_only=True),
+    'address': Address(),
+    'raw': Raw(),
+    'varlenBx2': VarLen('>B', 2),
+    'varlenH': VarLen('>H'),
+    'varlenHx20': VarLen('>H', 20),
+    'varlenH-list': ListOf(VarLen('>H')),
+    'varlenI': VarLen('>I'),
+    'doublevarlenH': VarLen('>H'),
+}
+
+
 class Serializer(object):
 
     def __init__(self):
         super(Serializer, self).__init__()
-        self._packers = {
-            '?': DefaultStruct(">?"),
-            'B': DefaultStruct(">B"),
-            'BBH': DefaultStruct(">BBH"),
-            'BH': DefaultStruct(">BH"),
-            'c': DefaultStruct(">c"),
-            'f': DefaultStruct(">f"),
-            'd': DefaultStruct(">d"),
-            'H': DefaultStruct(">H"),
-            'HH': DefaultStruct(">HH"),
-            'I': DefaultStruct(">I"),
-            'l': DefaultStruct(">l"),
-            'LL': DefaultStruct(">LL"),
-            'q': DefaultStruct(">q"),
-            'Q': DefaultStruct(">Q"),
-            'QH': DefaultStruct(">QH"),
-            'QL': DefaultStruct(">QL"),
-            'QQHHBH': DefaultStruct(">QQHHBH"),
-            'ccB': DefaultStruct(">ccB"),
-            '4SH': DefaultStruct(">4sH"),
-            '20s': DefaultStruct(">20s"),
-            '32s': DefaultStruct(">32s"),
-            '64s': DefaultStruct(">64s"),
-            '74s': DefaultStruct(">74s"),
-            'c20s': DefaultStruct(">c20s"),
-            'bits': Bits(),
-            'ipv4': IPv4(),
-            'ip_address': Address(ip_only=True),
-            'address': Address(),
-            'raw': Raw(),
-            'varlenBx2': VarLen('>B', 2),
-            'varlenH': VarLen('>H'),
-            'varlenHx20': VarLen('>H', 20),
-            'varlenH-list': ListOf(VarLen('>H')),
-            'varlenI': VarLen('>I'),
-            'doublevarlenH': VarLen('>H'),
-            'payload': NestedPayload(self),
-            'payload-list': ListOf(NestedPayload(self))
-        }
+        self._packers = dict(_STATELESS_PACKERS)
+        self._packers['payload'] = NestedPayload(self)
+        self._packers['payload-list'] = ListOf(NestedPayload(self))
+        self._unpack_plans = {}
 
     def get_available_formats(self):
         """
@@ -307,6 +320,7 @@ class Serializer(object):
         :param packer: the packer to use for it
         """
         self._packers[name] = packer
+        self._unpack_plans.clear()
 
     def pack(self, fmt, item):
         """
@@ -372,21 +386,39 @@ class Serializer(object):
         :param offset: the optional offset to unpack data from
         """
         unpack_list = []
-        for fmt in serializable.format_list:
+        for fmt, packer, args in self._get_unpack_plan(serializable):
             try:
-                offset = self._packers[fmt].unpack(data, offset, unpack_list)
-            except KeyError:
-                if not issubclass(fmt, Serializable):
-                    raise
-                offset = self._packers['payload'].unpack(data, offset, unpack_list, fmt)
-            except TypeError:
-                if not isinstance(fmt, list):
-                    raise
-                offset = self._packers['payload-list'].unpack(data, offset, unpack_list, fmt[0])
+                offset = packer.unpack(data, offset, unpack_list, *args)
             except Exception as e:
                 raise PackError("Could not unpack item: %s\n%s: %s" % (fmt, type(e).__name__, str(e))) from e
         return serializable.from_unpack_list(*unpack_list), offset
 
+    def _get_unpack_plan(self, serializable):
+        """
+        Get the packers to use, in order, to unpack a serializable class.
+
+        Resolving the formats of a serializable only depends on its class, so this is only done once per class.
+
+        :param serializable: the serializable class to get the packers for
+        :return: a list of (format, packer, extra unpack arguments) tuples
+        """
+        plan = self._unpack_plans.get(serializable)
+        if plan is None:
+            plan = []
+            for fmt in serializable.format_list:
+                try:
+                    plan.append((fmt, self._packers[fmt], ()))
+                except KeyError:
+                    if not issubclass(fmt, Serializable):
+                        raise
+                    plan.append((fmt, self._packers['payload'], (fmt,)))
+                except TypeError:
+                    if not isinstance(fmt, list):
+                        raise
+                    plan.append((fmt, self._packers['payload-list'], (fmt[0],)))
+            self._unpack_plans[serializable] = plan
+        return plan
+
     def unpack_serializable_list(self, serializables, data, offset=0, consume_all=True):
         """
         Use the formats specified in a list of serializable objects and unpack to them.
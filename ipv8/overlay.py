@@ -65,15 +65,17 @@ class Overlay(EndpointListener, TaskManager, metaclass=abc.ABCMeta):
         """
         Increments the current global time by one and returns this value.
         """
-        self.update_global_time(self.global_time + 1)
-        return self.global_time
+        global_time = self.my_peer.get_lamport_timestamp() + 1
+        self.my_peer.update_clock(global_time)
+        return global_time
 
     def update_global_time(self, global_time):
         """
         Increase the local global time if the given GLOBAL_TIME is larger.
+
+        The comparison is left to the Lamport clock of my_peer, so the global time never decreases.
         """
-        if global_time > self.global_time:
-            self.my_peer.update_clock(global_time)
+        self.my_peer.update_clock(global_time)
 
     def get_available_strategies(self):
         """
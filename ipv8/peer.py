@@ -1,6 +1,6 @@
 from base64 import b64encode
 from collections import deque
-from struct import unpack
+from struct import Struct
 from time import time
 from typing import Any, Dict, Optional, Type
 
@@ -9,6 +9,8 @@ from .keyvault.keys import Key
 from .messaging.interfaces.udp.endpoint import UDPv4Address, UDPv6Address
 from .types import Address
 
+_HASH_STRUCT = Struct(">Q")
+
 
 class DirtyDict(dict):
     """
@@ -155,14 +157,15 @@ class Peer(object):
 
         :param timestamp: a received timestamp
         """
-        self._lamport_timestamp = max(self._lamport_timestamp, timestamp)
+        if timestamp > self._lamport_timestamp:
+            self._lamport_timestamp = timestamp
         self.last_response = time()  # This is in seconds since the epoch
 
     def get_lamport_timestamp(self) -> int:
         return self._lamport_timestamp
 
     def __hash__(self) -> int:
-        as_long, = unpack(">Q", self.mid[:8])
+        as_long, = _HASH_STRUCT.unpack_from(self.mid)
         return as_long
 
     def __eq__(self, other: object) -> bool:
@@ -122,6 +122,31 @@ class TestCommunity(TestBase):
         self.assertEqual(1, len(db_entries))
         self.assertTrue(f.called)
 
+    async def test_request_attestation_small_chunks(self):
+        """
+        Check if the request_attestation callback is correctly called when the attestation is sent in many chunks.
+        """
+        def f(peer, attribute_name, _, __=None):
+            self.assertEqual(peer.address, self.address(1))
+            self.assertEqual(attribute_name, "MyAttribute")
+
+            f.called = True
+        f.called = False
+
+        await self.introduce_nodes()
+
+        self.overlay(0).chunk_size = 64
+        self.overlay(0).set_attestation_request_callback(lambda x, y, z: b"AttributeValue")
+        self.overlay(0).set_attestation_request_complete_callback(f)
+
+        self.overlay(1).request_attestation(self.my_peer(0), "MyAttribute", TestCommunity.private_key)
+
+        await self.deliver_messages(0.5)
+
+        db_entries = self.overlay(1).database.get_all()
+        self.assertEqual(1, len(db_entries))
+        self.assertTrue(f.called)
+
     async def test_request_attestation_big(self):
         """
         Check if the request_attestation callback is correctly called for id_metadata_big.
@@ -217,7 +217,7 @@ class TestBase(asynctest.TestCase):
         return d
 
     def address(self, i):
-        return self.peer(i).address
+        return self.nodes[i].endpoint.wan_address
 
     def endpoint(self, i):
         return self.nodes[i].endpoint
@@ -244,7 +244,7 @@ class TestBase(asynctest.TestCase):
         return self.nodes[i].overlay
 
     def peer(self, i):
-        return Peer(self.nodes[i].my_peer.public_key.key_to_bin(), self.nodes[i].endpoint.wan_address)
+        return Peer(self.nodes[i].my_peer.public_key, self.nodes[i].endpoint.wan_address)
 
     def private_key(self, i):
         return self.nodes[i].my_peer.key
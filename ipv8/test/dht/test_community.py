@@ -1,5 +1,5 @@
 import time
-from asyncio import TimeoutError, ensure_future, wait_for
+from asyncio import TimeoutError, ensure_future, gather, wait_for
 
 from .base import TestDHTBase
 from ..mocking.ipv8 import MockIPv8
@@ -68,6 +68,13 @@ class TestDHTCommunity(TestDHTBase):
         with self.assertRaises(DHTError):
             await self.overlay(0).store_value(self.key, self.value)
 
+    async def test_store_value_twice(self):
+        await self.introduce_nodes()
+        await self.overlay(0)._store(self.key, self.signed_in_store)
+        self.overlay(1).unserialize_value = lambda _: self.fail('Duplicate value should not be unserialized again')
+        await self.overlay(0)._store(self.key, self.signed_in_store)
+        self.assertEqual(self.storage(1).get(self.key), [self.signed_in_store])
+
     async def test_find_nodes(self):
         await self.introduce_nodes()
         nodes = await self.overlay(0).find_nodes(self.key)
@@ -163,8 +170,8 @@ class TestDHTCommunity(TestDHTBase):
         dht_provider_1 = DHTCommunityProvider(self.overlay(0), 1337)
         dht_provider_2 = DHTCommunityProvider(self.overlay(1), 1338)
         dht_provider_3 = DHTCommunityProvider(self.overlay(2), 1338)
-        await dht_provider_1.announce(b'a' * 20, IntroductionPoint(self.my_peer(0), b'\x01' * 20))
-        await dht_provider_2.announce(b'a' * 20, IntroductionPoint(self.my_peer(1), b'\x02' * 20))
+        await gather(dht_provider_1.announce(b'a' * 20, IntroductionPoint(self.my_peer(0), b'\x01' * 20)),
+                     dht_provider_2.announce(b'a' * 20, IntroductionPoint(self.my_peer(1), b'\x02' * 20)))
 
         await self.deliver_messages(.5)
 
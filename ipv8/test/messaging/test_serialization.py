@@ -139,6 +139,19 @@ class TestSerializer(TestBase):
 
         self.assertEqual([1, 256], unpacked)
 
+    def test_add_packer_after_unpack(self):
+        """
+        Check if a packer added on the fly is used for a serializable that was already unpacked before.
+        """
+        serialized = self.serializer.pack_serializable(Short(1))  # Packed as 00 01
+        before, _ = self.serializer.unpack_serializable(Short, serialized)
+
+        self.serializer.add_packer("H", DefaultStruct("<H"))  # little-endian
+        after, _ = self.serializer.unpack_serializable(Short, serialized)  # unpacked as 01 00 = 256
+
+        self.assertEqual(1, before.number)
+        self.assertEqual(256, after.number)
+
     def test_nested_serializable(self):
         """
         Check if we can unpack nested serializables.